@@ -1,39 +1,94 @@
+import timeit
+
+
 class IntegerSet:
     def __init__(self, initial_elements=None):
-        if initial_elements is None:
-            self.elements = []
-        else:
-            seen = set()
-            self.elements = [
-                x for x in initial_elements if not (x in seen or seen.add(x))
-            ]
+        # dict хранит элементы в порядке добавления и даёт O(1) на проверку, вставку и удаление
+        self.elements = dict.fromkeys(() if initial_elements is None else initial_elements)
+        self._sorted = None
+
+    def _sorted_elements(self):
+        # отсортированный вид кешируется до ближайшего изменения множества
+        if self._sorted is None:
+            self._sorted = sorted(self.elements)
+        return self._sorted
 
     def add(self, element):
         if element not in self.elements:
-            self.elements.append(element)
+            self.elements[element] = None
+            self._sorted = None
 
     def remove(self, element):
         if element in self.elements:
-            self.elements.remove(element)
+            del self.elements[element]
+            self._sorted = None
 
     def contains(self, element):
         return element in self.elements
 
-    def intersection(self, other):
+    def __contains__(self, element):
+        return element in self.elements
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __iter__(self):
+        return iter(self.elements)
+
+    @staticmethod
+    def _check(other, action):
         if not isinstance(other, IntegerSet):
-            raise ValueError("Can only intersect with another IntegerSet")
-        common = [x for x in self.elements if x in other.elements]
-        return IntegerSet(common)
+            raise ValueError(f"Can only {action} with another IntegerSet")
+
+    def intersection(self, other):
+        self._check(other, "intersect")
+        # перебираем меньшее множество, проверяем по большему
+        small, large = (self, other) if len(self) <= len(other) else (other, self)
+        return IntegerSet(x for x in small if x in large.elements)
+
+    def union(self, other):
+        self._check(other, "unite")
+        result = IntegerSet(self.elements)
+        result.elements.update(other.elements)
+        return result
+
+    def difference(self, other):
+        self._check(other, "subtract")
+        return IntegerSet(x for x in self if x not in other.elements)
+
+    def symmetric_difference(self, other):
+        self._check(other, "compare")
+        result = self.difference(other)
+        result.elements.update(dict.fromkeys(x for x in other if x not in self.elements))
+        return result
 
     def __str__(self):
         if not self.elements:
             return "{}"
-        return "{" + ", ".join(map(str, sorted(self.elements))) + "}"
+        return "{" + ", ".join(map(str, self._sorted_elements())) + "}"
 
     def __eq__(self, other):
         if not isinstance(other, IntegerSet):
             return False
-        return sorted(self.elements) == sorted(other.elements)
+        return self.elements.keys() == other.elements.keys()
+
+
+def benchmark(size=10**6, lookups=100, list_size=10**4):
+    first = IntegerSet(range(size))
+    second = IntegerSet(range(size // 2, size + size // 2))
+    as_list = list(range(size))
+    probes = range(size - lookups, size)
+
+    old = timeit.timeit(lambda: [x in as_list for x in probes], number=1)
+    new = timeit.timeit(lambda: [first.contains(x) for x in probes], number=1)
+    print(f"contains x{lookups} on {size}: list {old:.4f} s, hash {new:.6f} s")
+
+    small_first, small_second = list(range(list_size)), list(range(list_size // 2, list_size + list_size // 2))
+    old = timeit.timeit(lambda: [x for x in small_first if x in small_second], number=1)
+    print(f"intersection on {list_size}: list {old:.4f} s")
+    for name in ("intersection", "union", "difference", "symmetric_difference"):
+        elapsed = timeit.timeit(lambda name=name: getattr(first, name)(second), number=1)
+        print(f"{name} on {size}: hash {elapsed:.4f} s")
 
 
 def main():
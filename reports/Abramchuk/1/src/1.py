@@ -1,14 +1,106 @@
-str_list = input("Введите целые числа через пробел: ").split()
-nums = []
+import argparse
+import os
+import re
+import sys
 
-try:
-    for item in str_list:
-        nums.append(int(item))
+import numpy as np
 
-    if len(set(nums)) == 1:
-        print("Все числа равны")
-    else:
-        print("Числа не равны")
+TOKEN = re.compile(rb"\S+")
+CHUNK_ITEMS = 1 << 20
 
-except ValueError:
-    print("Ошибка: вводить можно только целые числа")
+
+# Числа разбираются лениво прямо из байтового буфера: (номер, смещение в байтах, значение)
+def iter_numbers(buffer):
+    for index, match in enumerate(TOKEN.finditer(buffer)):
+        yield index, match.start(), int(match.group())
+
+
+# Номер и смещение первого числа, отличного от первого; None, если все равны. Останавливается сразу
+def first_difference(buffer):
+    numbers = iter_numbers(buffer)
+    first = next(numbers, None)
+    if first is None:
+        return None
+    for index, offset, value in numbers:
+        if value != first[2]:
+            return index, offset
+    return None
+
+
+# Не больше ли limit различных значений; перестаёт читать, как только их стало больше
+def distinct_at_most(buffer, limit):
+    seen = set()
+    for _, _, value in iter_numbers(buffer):
+        seen.add(value)
+        if len(seen) > limit:
+            return False
+    return True
+
+
+# Векторный режим для бинарного файла из чисел dtype: номер первого отличного элемента или None
+def first_difference_binary(path, dtype="<i8", chunk_items=CHUNK_ITEMS):
+    # np.memmap не отображает пустой файл, поэтому размер проверяется заранее
+    if os.path.getsize(path) == 0:
+        return None
+    data = np.memmap(path, dtype=dtype, mode="r")
+    first = data[0]
+    for start in range(0, data.size, chunk_items):
+        chunk = data[start : start + chunk_items]
+        same = chunk == first
+        if not same.all():
+            return start + int(np.argmin(same))
+    return None
+
+
+# Векторный режим для текстового файла: куски разбираются по пробельным токенам, номер первого отличного числа.
+# np.fromstring здесь не годится - кусок из одних пробелов он превращает в [0]
+def first_difference_text(path, chunk_bytes=CHUNK_ITEMS * 8):
+    first, seen, tail = None, 0, b""
+    with open(path, "rb") as file:
+        while True:
+            block = file.read(chunk_bytes)
+            last = not block
+            block = tail + block
+            cut = len(block) if last else max(block.rfind(sep) for sep in b" \t\r\n")
+            tail = block[cut + 1 :] if not last else b""
+            chunk = np.array(block[: cut + 1].split(), dtype=np.int64)
+            if chunk.size:
+                first = chunk[0] if first is None else first
+                same = chunk == first
+                if not same.all():
+                    return seen + int(np.argmin(same))
+                seen += chunk.size
+            if last:
+                return None
+
+
+def main():
+    if len(sys.argv) > 1:
+        parser = argparse.ArgumentParser(description="Проверка, что все числа в файле равны")
+        parser.add_argument("file", help="файл с числами")
+        parser.add_argument("--binary", action="store_true", help="файл из упакованных целых dtype")
+        parser.add_argument("--dtype", default="<i8", help="тип элементов бинарного файла")
+        args = parser.parse_args()
+        if args.binary:
+            index = first_difference_binary(args.file, args.dtype)
+        else:
+            index = first_difference_text(args.file)
+        print("Все числа равны" if index is None else f"Числа не равны: первое отличие - число №{index}")
+        return
+
+    line = input("Введите целые числа через пробел: ").encode()
+    try:
+        difference = first_difference(line)
+        if not TOKEN.search(line):
+            print("Числа не равны")
+        elif difference is None:
+            print("Все числа равны")
+        else:
+            print("Числа не равны")
+
+    except ValueError:
+        print("Ошибка: вводить можно только целые числа")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+from itertools import combinations, product
+
+import numpy as np
+
+
+# Один проход с хеш-таблицей: O(n)
+def two_sum(nums, target):
+    seen = {}
+    for j, num in enumerate(nums):
+        i = seen.get(target - num)
+        if i is not None:
+            return i, j
+        seen.setdefault(num, j)
+    return None
+
+
+# Два указателя для уже отсортированного массива: O(n), без дополнительной памяти
+def two_sum_sorted(nums, target):
+    i, j = 0, len(nums) - 1
+    while i < j:
+        total = nums[i] + nums[j]
+        if total == target:
+            return i, j
+        if total < target:
+            i += 1
+        else:
+            j -= 1
+    return None
+
+
+def index_positions(nums):
+    positions = {}
+    for i, num in enumerate(nums):
+        positions.setdefault(num, []).append(i)
+    return positions
+
+
+# Все пары индексов (i < j): перебираются только совпавшие значения, время O(n + число пар)
+def all_pairs(nums, target, positions=None):
+    if positions is None:
+        positions = index_positions(nums)
+    for num, indices in positions.items():
+        other = target - num
+        if num == other:
+            yield from combinations(indices, 2)
+        elif num < other and other in positions:
+            for i, j in product(indices, positions[other]):
+                yield (i, j) if i < j else (j, i)
+
+
+class TwoSumIndex:
+    # Индекс "значение -> индексы" строится один раз, затем отвечает на много target
+    def __init__(self, nums):
+        self.positions = index_positions(nums)
+        # ключи остаются исходными объектами, а массив берёт их собственный тип: int64, float64
+        # или object для чисел шире 64 бит - без усечения, которое потеряло бы ключи positions
+        self.keys = sorted(self.positions)
+        self.values = np.asarray(self.keys) if self.keys else np.empty(0, dtype=np.int64)
+        if self.values.dtype.kind not in "biufO":
+            raise TypeError(f"ожидаются числа, получен массив типа {self.values.dtype}")
+        self.repeated = np.array([len(self.positions[num]) > 1 for num in self.keys], dtype=bool)
+
+    def query(self, target):
+        values = self.values
+        if not values.size:
+            return None
+        other = target - values
+        found = np.searchsorted(values, other)
+        found[found == values.size] = 0
+        match = values[found] == other
+        # пара из одного и того же значения нужна хотя бы в двух экземплярах
+        match &= (other != values) | self.repeated
+        hits = np.flatnonzero(match)
+        if not hits.size:
+            return None
+        num, other = self.keys[hits[0]], self.keys[found[hits[0]]]
+        if num == other:
+            return tuple(self.positions[num][:2])
+        i, j = self.positions[num][0], self.positions[other][0]
+        return (i, j) if i < j else (j, i)
+
+    def query_many(self, targets):
+        return [self.query(target) for target in targets]
+
+    def all_pairs(self, target):
+        return all_pairs(None, target, self.positions)
@@ -1,17 +1,91 @@
 """1.2)"""
 
-def product(nums) :
-    """произведение"""
+import math
+
+import numpy as np
+
+BLOCK = 1 << 16
+
+
+def product(nums):
+    """произведение деревом: перемножаются соседние пары, размеры множителей растут равномерно"""
+    if len(nums) == 0:
+        return 0
+    level = list(nums)
+    while len(level) > 1:
+        paired = [left * right for left, right in zip(level[::2], level[1::2])]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def product_mod(nums, modulus):
+    """произведение по модулю: числа не растут, хватает одного прохода"""
     if len(nums) == 0:
-        return  0
-    prod = 1
+        return 0
+    prod = 1 % modulus
     for num in nums:
-        prod*=num
+        prod = prod * num % modulus
     return prod
 
-if __name__ == '__main__':
-    mas = list(map(int,(input("mas: ").split())))
-    print("max: ",max(mas))
-    print("min: ",min(mas))
-    print("sum: ",sum(mas))
-    print("prod: ",product(mas))
+
+def log_product(nums):
+    """знак и десятичный логарифм модуля произведения - оценка величины без переполнения"""
+    if len(nums) == 0:
+        return 0, -math.inf
+    sign, logs = 1, []
+    for num in nums:
+        if num == 0:
+            return 0, -math.inf
+        if num < 0:
+            sign = -sign
+        logs.append(math.log10(abs(num)))
+    return sign, math.fsum(logs)
+
+
+def _scalar(value):
+    # у массивов dtype=object редукции возвращают уже числа Python
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def stats(mas):
+    """минимум, максимум, сумма и произведение за один проход по типизированному массиву
+
+    массив обходится блоками по BLOCK элементов: пока блок в кеше, минимум, максимум и сумма
+    берутся редукциями NumPy; в числа Python блок переводится только для точного произведения,
+    а произведения блоков перемножаются деревом
+    """
+    mas = np.asarray(mas)
+    if mas.size == 0:
+        raise ValueError("пустой массив")
+    exact = mas.dtype.kind in "iubO"
+    low, high, total, parts = math.inf, -math.inf, 0, []
+    for start in range(0, mas.size, BLOCK):
+        block = mas[start : start + BLOCK]
+        block_low, block_high = _scalar(block.min()), _scalar(block.max())
+        low, high = min(low, block_low), max(high, block_high)
+        if not exact:
+            total += _scalar(block.sum())
+            parts.append(_scalar(block.prod()))
+            continue
+        # сумма в int64 точна, пока модуль суммы заведомо меньше 2 ** 63
+        if block.dtype.kind in "iu" and max(-block_low, block_high) * block.size >= 1 << 63:
+            total += sum(block.tolist())
+        else:
+            total += _scalar(block.sum())
+        parts.append(0 if block_low <= 0 <= block_high and not block.all() else product(block.tolist()))
+    return low, high, total, product(parts)
+
+
+def main():
+    mas = list(map(int, (input("mas: ").split())))
+    low, high, total, prod = stats(mas)
+    print("max: ", high)
+    print("min: ", low)
+    print("sum: ", total)
+    print("prod: ", prod)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,81 @@
 """1.2)"""
 
-if __name__ == '__main__':
-    m = int(input("m:"))
-    n = int(input("n:"))
-    nums1=[]
-    nums2=[]
-
-    for i in range(m):
-        nums1.append(i)
-    for i in range(n):
-        nums1.append(0)
-    print("nums1",nums1)
-    for i in range(n):
-        nums2.append(i)
-    print("nums2",nums2)
-
-    for i in range(n):
-        nums1[m+i]=nums2[i]
-    nums1.sort()
-    print("sorted:",nums1)
+import heapq
+from contextlib import ExitStack
+
+import numpy as np
+
+
+def merge(nums1, m, nums2, n):
+    """слияние на месте с конца: O(m + n), nums1 длины m + n"""
+    i, j, k = m - 1, n - 1, m + n - 1
+    while j >= 0:
+        if i >= 0 and nums1[i] > nums2[j]:
+            nums1[k] = nums1[i]
+            i -= 1
+        else:
+            nums1[k] = nums2[j]
+            j -= 1
+        k -= 1
+    return nums1
+
+
+def merge_streams(*iterables, key=None, reverse=False):
+    """k-путевое слияние отсортированных итераторов через кучу, результат отдаётся потоком"""
+    return heapq.merge(*iterables, key=key, reverse=reverse)
+
+
+def _read_numbers(file):
+    for line in file:
+        line = line.strip()
+        if line:
+            yield int(line)
+
+
+def merge_files(paths, target):
+    """слияние отсортированных файлов (по числу в строке) в открытый на запись target"""
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(path, encoding="utf-8")) for path in paths]
+        for value in merge_streams(*(_read_numbers(file) for file in files)):
+            target.write(f"{value}\n")
+
+
+def merge_arrays(first, second):
+    """слияние двух отсортированных массивов NumPy: позиции второго находятся searchsorted"""
+    first, second = np.asarray(first), np.asarray(second)
+    result = np.empty(first.size + second.size, dtype=np.result_type(first, second))
+    positions = np.searchsorted(first, second, side="right") + np.arange(second.size)
+    mask = np.ones(result.size, dtype=bool)
+    mask[positions] = False
+    result[positions] = second
+    result[mask] = first
+    return result
+
+
+def merge_many_arrays(arrays):
+    """много массивов сливаются попарно деревом, каждый элемент участвует в log k слияниях"""
+    arrays = [np.asarray(array) for array in arrays]
+    if not arrays:
+        return np.empty(0)
+    while len(arrays) > 1:
+        merged = [merge_arrays(left, right) for left, right in zip(arrays[::2], arrays[1::2])]
+        if len(arrays) % 2:
+            merged.append(arrays[-1])
+        arrays = merged
+    return arrays[0]
+
+
+def main():
+    size1 = int(input("m:"))
+    size2 = int(input("n:"))
+    first = list(range(size1)) + [0] * size2
+    print("nums1", first)
+    second = list(range(size2))
+    print("nums2", second)
+
+    merge(first, size1, second, size2)
+    print("sorted:", first)
+
+
+if __name__ == "__main__":
+    main()
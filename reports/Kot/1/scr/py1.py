@@ -1,3 +1,10 @@
+from collections import namedtuple
+
+import numpy as np
+
+Outliers = namedtuple("Outliers", ["values", "indices", "deviations", "scores"])
+
+
 def find_outlier_median(seq):
     seq_sorted = sorted(seq)
     median = seq_sorted[len(seq) // 2]
@@ -5,6 +12,65 @@ def find_outlier_median(seq):
     return outlier
 
 
-numbers = list(map(int, input("Enter array: ").split()))
-print("Array:", numbers)
-print("Outlier:", find_outlier_median(numbers))
+def _upper_median(matrix):
+    # та же медиана, что и в find_outlier_median: элемент с индексом len // 2, но без полной сортировки
+    middle = matrix.shape[1] // 2
+    return np.partition(matrix, middle, axis=1)[:, middle]
+
+
+def _deviation(matrix, median):
+    # |x - median| без переполнения: у целых разность считается по модулю 2 ** 64 в uint64 из большего
+    # вычитается меньшее, поэтому она точна и для uint8, и для крайних int64
+    if matrix.dtype.kind not in "biu":
+        return np.abs(matrix - median)
+    unsigned, center = matrix.astype(np.uint64), median.astype(np.uint64)
+    return np.where(matrix >= median, unsigned - center, center - unsigned)
+
+
+def _outliers_2d(matrix):
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 2 or matrix.shape[1] == 0:
+        raise ValueError("ожидается непустой двумерный массив")
+    median = _upper_median(matrix)
+    deviation = _deviation(matrix, median[:, None])
+    indices = deviation.argmax(axis=1)
+    rows = np.arange(matrix.shape[0])
+    mad = _upper_median(deviation)
+    worst = deviation[rows, indices]
+    scores = np.divide(worst, mad, out=np.full(worst.shape, np.inf), where=mad != 0)
+    scores[(worst == 0) & (mad == 0)] = 0.0
+    return Outliers(matrix[rows, indices], indices, worst, scores)
+
+
+def find_outliers_batch(sequences):
+    # двумерный массив считается целиком, рваный список - группами строк одинаковой длины
+    if isinstance(sequences, np.ndarray):
+        return _outliers_2d(sequences)
+    sequences = list(sequences)
+    groups = {}
+    for row, seq in enumerate(sequences):
+        groups.setdefault(len(seq), []).append(row)
+
+    parts = [(rows, _outliers_2d(np.array([sequences[row] for row in rows]))) for rows in groups.values()]
+    # типы результата - общие для всех групп, чтобы большие int64 не округлялись через float64
+    kinds = [part for _, part in parts] or [Outliers(*[np.empty(0)] * 4)]
+    count = len(sequences)
+    values = np.empty(count, dtype=np.result_type(*(part.values for part in kinds)))
+    indices = np.empty(count, dtype=np.intp)
+    deviations = np.empty(count, dtype=np.result_type(*(part.deviations for part in kinds)))
+    scores = np.empty(count, dtype=np.float64)
+    for rows, part in parts:
+        values[rows], indices[rows], deviations[rows], scores[rows] = part
+    return Outliers(values, indices, deviations, scores)
+
+
+def find_outliers_chunked(matrix, chunk_rows=100_000):
+    # для массивов больше памяти (np.memmap, np.load(..., mmap_mode="r")) - по chunk_rows строк за раз
+    for start in range(0, matrix.shape[0], chunk_rows):
+        yield start, _outliers_2d(np.asarray(matrix[start : start + chunk_rows]))
+
+
+if __name__ == "__main__":
+    numbers = list(map(int, input("Enter array: ").split()))
+    print("Array:", numbers)
+    print("Outlier:", find_outlier_median(numbers))
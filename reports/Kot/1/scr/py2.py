@@ -1,5 +1,12 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.palindrome import is_number_palindrome  # pylint: disable=wrong-import-position
+
+
 def is_palindrome(x):
-    return str(x) == str(x)[::-1]
+    return is_number_palindrome(x)
 
 
 value = int(input("Enter: "))
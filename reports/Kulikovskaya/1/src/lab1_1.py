@@ -1,11 +1,157 @@
 # для последовательности из N целых чисел реализовать обработку
 # вывод процента чисел, которые больше среднего значения
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from pathlib import Path
 
-N = list(map(int, input("Введите последовательность чисел: ").split()))
-averageN = sum(N) / len(N) if N else 0
-count_above_average = 0
-for num in N:
-    if num > averageN:
-        count_above_average += 1
-percentage = round(((count_above_average / len(N)) * 100), 2)
-print(f"percent= {percentage}%")
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.reader import is_interactive, read_ints  # pylint: disable=wrong-import-position
+
+CHUNK_ITEMS = 1 << 22
+CHUNK_BYTES = 1 << 24
+SEPARATORS = (b" ", b"\t", b"\r", b"\n")
+
+
+def binary_chunks(path, dtype="<i8", chunk_items=CHUNK_ITEMS):
+    # бинарный файл через np.memmap: в память попадает только текущий кусок
+    if os.path.getsize(path) == 0:
+        return
+    data = np.memmap(path, dtype=dtype, mode="r")
+    for start in range(0, data.shape[0], chunk_items):
+        yield data[start : start + chunk_items]
+
+
+def text_ranges(path, chunk_bytes=CHUNK_BYTES):
+    # байтовые диапазоны по chunk_bytes; конец диапазона сдвигается вперёд до ближайшего разделителя,
+    # чтобы число не разрезалось между двумя кусками
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            file.seek(end)
+            while end < size:
+                window = file.read(256)
+                cut = min((index for index in map(window.find, SEPARATORS) if index >= 0), default=-1)
+                if cut >= 0:
+                    end += cut + 1
+                    break
+                end += len(window)
+            yield start, end
+            start = end
+
+
+def _read_range(path, start, end):
+    with open(path, "rb") as file:
+        file.seek(start)
+        return _parse(file.read(end - start))
+
+
+def text_chunks(path, chunk_bytes=CHUNK_BYTES):
+    # текстовый файл кусками по chunk_bytes, без разрезанных чисел
+    for start, end in text_ranges(path, chunk_bytes):
+        yield _read_range(path, start, end)
+
+
+def _parse(chunk):
+    tokens = chunk.split()
+    try:
+        return np.array(tokens, dtype=np.int64)
+    except OverflowError:
+        # числа шире int64 остаются точными int Python
+        return np.array(list(map(int, tokens)), dtype=object)
+
+
+def _sum_count(chunk):
+    # дробные суммируются в своём типе; целые - в int64, пока сумма куска заведомо не переполнится,
+    # иначе точно в int Python (как stats в Bondarchuk/1/src/task_1.py)
+    if not chunk.shape[0]:
+        return 0, 0
+    if chunk.dtype.kind == "f":
+        return chunk.sum().item(), chunk.shape[0]
+    if chunk.dtype.kind in "iu":
+        low, high = chunk.min().item(), chunk.max().item()
+        if max(-low, high) * chunk.shape[0] < 1 << 63:
+            return int(chunk.sum(dtype=np.int64)), chunk.shape[0]
+    return sum(chunk.tolist()), chunk.shape[0]
+
+
+def _count_above(chunk, threshold):
+    return int(np.count_nonzero(chunk > threshold))
+
+
+def _range_sum_count(path, start, end):
+    return _sum_count(_read_range(path, start, end))
+
+
+def _range_above(path, start, end, threshold):
+    return _count_above(_read_range(path, start, end), threshold)
+
+
+def _percent(sum_counts, above_counts):
+    # above_counts(threshold) - количество чисел больше threshold по всем кускам.
+    # Для целых x > total / count равносильно x > total // count: порог - точное целое в пределах
+    # данных, поэтому сравнение не теряет точность даже за 2 ** 53
+    total, count = 0, 0
+    for chunk_sum, chunk_count in sum_counts:
+        total += chunk_sum
+        count += chunk_count
+    if not count:
+        return None
+    threshold = total // count if isinstance(total, int) else total / count
+    return round(sum(above_counts(threshold)) / count * 100, 2)
+
+
+def percent_above_average(chunks, workers=None):
+    # chunks - функция, которая каждый раз заново выдаёт куски (файл читается в два прохода);
+    # сумма и сравнение в NumPy отпускают GIL, поэтому для готовых массивов хватает потоков
+    with ThreadPoolExecutor(max_workers=workers or 1) as pool:
+        return _percent(
+            pool.map(_sum_count, chunks()),
+            lambda threshold: pool.map(_count_above, chunks(), repeat(threshold)),
+        )
+
+
+def percent_above_average_text(path, workers=None, chunk_bytes=CHUNK_BYTES):
+    # разбор текста держит GIL, поэтому диапазоны файла разбирают процессы: каждый сам читает
+    # свой диапазон, а в главный процесс возвращаются только суммы и счётчики
+    ranges = list(text_ranges(path, chunk_bytes))
+    starts, ends = [start for start, _ in ranges], [end for _, end in ranges]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _percent(
+            pool.map(_range_sum_count, repeat(path), starts, ends),
+            lambda threshold: pool.map(_range_above, repeat(path), starts, ends, repeat(threshold)),
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Процент чисел больше среднего")
+    parser.add_argument("file", nargs="?", help="файл с числами; без него - ввод с клавиатуры")
+    parser.add_argument("--binary", action="store_true", help="файл из упакованных целых dtype")
+    parser.add_argument("--dtype", default="<i8", help="тип элементов бинарного файла")
+    parser.add_argument("--workers", type=int, default=None, help="число потоков для --binary, процессов для текста")
+    args = parser.parse_args()
+
+    if args.file is None:
+        if is_interactive():
+            N = _parse(input("Введите последовательность чисел: ").encode())
+        else:
+            N = np.asarray(read_ints())
+        percentage = percent_above_average(lambda: [N])
+    elif args.binary:
+        percentage = percent_above_average(lambda: binary_chunks(args.file, args.dtype), args.workers)
+    else:
+        percentage = percent_above_average_text(args.file, args.workers)
+    if percentage is None:
+        print("Ошибка: последовательность пуста")
+    else:
+        print(f"percent= {percentage}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,88 @@
 # непосредственно над ними
 # Input: numRows = 5
 # Output: [[1],[1,1],[1,2,1],[1,3,3,1],[1,4,6,4,1]]
+from array import array
+
+
+def iter_rows(n):
+    # строки по одной, в памяти только предыдущая
+    _row = [1]
+    for _ in range(n):
+        yield _row
+        _row = [1] + [left + right for left, right in zip(_row, _row[1:])] + [1]
 
 
 def pascal_triangle(n):
-    triangle = []
+    return list(iter_rows(n))
+
+
+def row(k):
+    # k-я строка (с нуля) за O(k): C(k, j + 1) = C(k, j) * (k - j) / (j + 1)
+    _row = [1] * (k + 1)
+    for j in range(k // 2):
+        _row[j + 1] = _row[k - j - 1] = _row[j] * (k - j) // (j + 1)
+    return _row
+
+
+def _small_coefficient(n, k, mod):
+    numerator, denominator = 1, 1
+    for j in range(min(k, n - k)):
+        numerator = numerator * (n - j) % mod
+        denominator = denominator * (j + 1) % mod
+    return numerator * pow(denominator, -1, mod) % mod
+
+
+def coefficient(n, k, mod=None):
+    # C(n, k); при mod - по теореме Люка, mod должен быть простым
+    if k < 0 or k > n:
+        return 0
+    if mod is None:
+        return row_coefficient(n, k)
+    result = 1
+    while n or k:
+        digit_n, digit_k = n % mod, k % mod
+        if digit_k > digit_n:
+            return 0
+        result = result * _small_coefficient(digit_n, digit_k, mod) % mod
+        n //= mod
+        k //= mod
+    return result
+
+
+def row_coefficient(n, k):
+    value = 1
+    for j in range(min(k, n - k)):
+        value = value * (n - j) // (j + 1)
+    return value
+
+
+def _rows_mod_inplace(n, mod):
+    # строки по модулю в одном массиве array('q'), который обновляется на месте справа налево;
+    # mod < 2 ** 62, чтобы сумма двух остатков помещалась в int64. Каждый раз отдаётся тот же буфер
+    _row = array("q", [1 % mod])
     for i in range(n):
-        _row = [None for _ in range(i + 1)]
-        _row[0], _row[-1] = 1, 1
-        for j in range(1, i):
-            _row[j] = triangle[i - 1][j - 1] + triangle[i - 1][j]
-        triangle.append(_row)
-    return triangle
+        if i:
+            _row.append(1 % mod)
+            for j in range(i - 1, 0, -1):
+                _row[j] = (_row[j] + _row[j - 1]) % mod
+        yield _row
+
+
+def iter_rows_mod(n, mod):
+    # как iter_rows: каждая строка - отдельный объект, его можно сохранить
+    for _row in _rows_mod_inplace(n, mod):
+        yield array("q", _row)
+
+
+def row_mod(k, mod):
+    # нужна только последняя строка, поэтому копии промежуточных не делаются
+    _row = array("q")
+    for _row in _rows_mod_inplace(k + 1, mod):
+        pass
+    return _row
 
 
-numRows = int(input("введите количество строк: "))
-for row in pascal_triangle(numRows):
-    print(row)
+if __name__ == "__main__":
+    numRows = int(input("введите количество строк: "))
+    for _row in iter_rows(numRows):
+        print(_row)
@@ -1,15 +1,76 @@
-def rep(start_value: int, end_value: int, step_value: int) -> None:
+import argparse
+import sys
+from array import array
+from typing import BinaryIO, Optional
+
+CHUNK_SIZE = 1 << 16
+BUFFER_SIZE = 1 << 20
+
+
+def emit_range(
+    numbers: range,
+    target: BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+    separator: str = " ",
+    binary: bool = False,
+    *,
+    buffer_size: int = BUFFER_SIZE,
+) -> None:
+    # числа форматируются кусками по chunk_size, а не по одному вызову print на число;
+    # куски копятся в одном bytearray и уходят в target, когда набралось buffer_size байт
+    pending = bytearray()
+    for start in range(0, len(numbers), chunk_size):
+        part = numbers[start : start + chunk_size]
+        if binary:
+            pending += array("q", part).tobytes()
+        else:
+            pending += (separator.join(map(str, part)) + separator).encode()
+        if len(pending) >= buffer_size:
+            target.write(pending)
+            pending.clear()
+    if pending:
+        target.write(pending)
+
+
+def rep(
+    start_value: int,
+    end_value: int,
+    step_value: int,
+    *,
+    output: Optional[str] = None,
+    binary: bool = False,
+    buffer_size: int = BUFFER_SIZE,
+) -> None:
     if step_value == 0:
         print("Ошибка: шаг не может быть равен 0")
         return
 
-    for number in range(start_value, end_value + 1, step_value):
-        print(number, end=" ")
+    numbers = range(start_value, end_value + 1, step_value)
+    if output is not None:
+        with open(output, "wb", buffering=buffer_size) as target:
+            emit_range(numbers, target, binary=binary, buffer_size=buffer_size)
+        return
 
-    print()
+    sys.stdout.flush()
+    emit_range(numbers, sys.stdout.buffer, binary=binary, buffer_size=buffer_size)
+    if not binary:
+        sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
 
 
 def main() -> None:
+    if len(sys.argv) > 1:
+        parser = argparse.ArgumentParser(description="Вывод чисел от start до end с шагом step")
+        parser.add_argument("start", type=int)
+        parser.add_argument("end", type=int)
+        parser.add_argument("step", type=int)
+        parser.add_argument("--output", help="файл для вывода вместо стандартного потока")
+        parser.add_argument("--binary", action="store_true", help="упакованные int64 вместо текста")
+        parser.add_argument("--buffer", type=int, default=BUFFER_SIZE, help="размер буфера записи в байтах")
+        args = parser.parse_args()
+        rep(args.start, args.end, args.step, output=args.output, binary=args.binary, buffer_size=args.buffer)
+        return
+
     try:
         start_value = int(input("Введите начало (start): "))
         end_value = int(input("Введите конец (end): "))
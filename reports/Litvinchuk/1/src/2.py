@@ -1,6 +1,8 @@
-def is_palindrome(text: str) -> bool:
-    filtered = "".join(char for char in text.lower() if char.isalnum())
-    return filtered == filtered[::-1]
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.palindrome import is_palindrome  # pylint: disable=wrong-import-position
 
 
 def main() -> None:
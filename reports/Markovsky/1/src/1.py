@@ -1,7 +1,15 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.spread import min_max  # pylint: disable=wrong-import-position
+
 try:
     n = list(map(int, input("Введите последовательность целых чисел: ").split()))
     if len(n) == 0:
         print("Последовательность пустая")
-    print(f"Размах последовательности: {max(n)} - {min(n)} = {max(n) - min(n)}")
+    else:
+        low, high = min_max(n)
+        print(f"Размах последовательности: {high} - {low} = {high - low}")
 except ValueError:
     print("Последовательность некорректна - введите целые числа!")
@@ -1,13 +1,62 @@
-s = str()
-strs = list(map(str, input("Введите строки: ").split()))
-if len(strs) > 0:
-    strs.sort()
-    min_word = min(strs[0], strs[-1])
-    max_word = max(strs[0], strs[-1])
+import mmap
+import sys
 
+CHUNK_SIZE = 1 << 20
+
+
+def common_prefix(min_word, max_word):
     for i, value in enumerate(min_word):
-        if min_word[i] == max_word[i]:
-            s += min_word[i]
-        else:
+        if i >= len(max_word) or value != max_word[i]:
+            return min_word[:i]
+    return min_word
+
+
+def chunk_min_max(stream, chunk_size=CHUNK_SIZE):
+    # читаем кусками и храним только текущие минимум и максимум, а не весь список строк
+    min_word = max_word = None
+    tail = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
             break
+        chunk = tail + chunk
+        words = chunk.split()
+        # последнее слово могло оборваться на границе куска - доклеим его к следующему
+        tail = b"" if chunk[-1:].isspace() or not words else words.pop()
+        if words:
+            low, high = min(words), max(words)
+            min_word = low if min_word is None else min(min_word, low)
+            max_word = high if max_word is None else max(max_word, high)
+    if tail:
+        min_word = tail if min_word is None else min(min_word, tail)
+        max_word = tail if max_word is None else max(max_word, tail)
+    return min_word, max_word
+
+
+def stream_prefix(stream, chunk_size=CHUNK_SIZE):
+    min_word, max_word = chunk_min_max(stream, chunk_size)
+    if min_word is None:
+        return ""
+    # байтовый порядок UTF-8 совпадает с порядком символов, обрезанный хвост символа отбрасываем
+    return common_prefix(min_word, max_word).decode("utf-8", errors="ignore")
+
+
+def file_prefix(path, chunk_size=CHUNK_SIZE):
+    with open(path, "rb") as file:
+        try:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return stream_prefix(mapped, chunk_size)
+        except ValueError:
+            # пустой файл нельзя отобразить в память
+            return ""
+
+
+if len(sys.argv) > 1:
+    if sys.argv[1] == "-":
+        s = stream_prefix(sys.stdin.buffer)
+    else:
+        s = file_prefix(sys.argv[1])
+else:
+    strs = list(map(str, input("Введите строки: ").split()))
+    s = common_prefix(min(strs), max(strs)) if strs else str()
 print("Cамая длинная общая строка префикса среди списка строк:", s)
@@ -1,9 +1,116 @@
+import sys
+from operator import index as as_index
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.popcount import BYTE_TABLE, popcount_buffer  # pylint: disable=wrong-import-position
+
+# наибольшая ширина окна, которое выводится из данных (128 МБ битов); явный domain её не ограничен
+MAX_DOMAIN = 1 << 30
+
+
+def _align(value):
+    # начало окна кратно 8, чтобы карты разных множеств совпадали по байтам
+    return value - value % 8
+
+
 class IntegerSet:
-    def __init__(self, max_size, elements=None):
-        if elements is None:
-            elements = []
+    # Множество целых как битовая карта в bytearray со смещением: бит (x - base) установлен, если x входит.
+    # Окно [low, low + domain) задаётся явно или выводится из данных и растёт по мере add.
+    # Мощность хранится отдельно, объединение и пересечение - побитовые | и & над массивами NumPy
+    def __init__(self, max_size, elements=None, low=None, domain=None):
         self.max_size = max_size
-        self.elements = list(set(elements))[:max_size]
+        self.low = low if low is not None or domain is None else 0
+        self.domain = domain
+        self.base = _align(self.low) if self.low is not None else 0
+        self.bits = bytearray()
+        self.size = 0
+        if elements is not None:
+            self._fill(elements)
+
+    def _values(self, elements):
+        # целочисленные массивы проверяются целиком на NumPy; остальное идёт через int(), как в add
+        items = elements if isinstance(elements, np.ndarray) else list(elements)
+        values = np.asarray(items).ravel()
+        if values.dtype.kind not in "iu":
+            items = items.ravel().tolist() if isinstance(items, np.ndarray) else items
+            values = np.asarray([item for item in map(self._to_int, items) if item is not None]).ravel()
+        if values.size and values.dtype.kind in "iu":
+            # сдвиг на base считается в int64: в узких и беззнаковых типах он бы переполнился
+            values = values.astype(np.int64 if values.dtype.kind == "i" or values.max() < 1 << 63 else object)
+        return values
+
+    def _fill(self, elements):
+        values = self._values(elements)
+        if not values.size:
+            return
+        low, high = self._bounds(int(values.min()))
+        if values.dtype == object:
+            # числа шире int64 сравниваются и сдвигаются как int Python
+            inside = np.array([low <= value < high for value in values.tolist()], dtype=bool)
+        else:
+            inside = (values >= low) & (values < high)
+        for value in values[~inside].tolist():
+            self._reject(value)
+        values = values[inside]
+        if not values.size:
+            return
+        self.base = _align(int(values.min()) if self.low is None else self.low)
+        if values.dtype == object:
+            offsets = np.array([value - self.base for value in values.tolist()], dtype=np.int64)
+        else:
+            offsets = (values - self.base).astype(np.int64)
+        marks = np.zeros(int(offsets.max()) + 1, dtype=bool)
+        marks[offsets] = True
+        count = int(np.count_nonzero(marks))
+        if count > self.max_size:
+            # различных больше max_size - остаются первые max_size в порядке появления
+            unique, first = np.unique(offsets, return_index=True)
+            marks[:] = False
+            marks[unique[np.argsort(first)[: self.max_size]]] = True
+            count = self.max_size
+        self.bits = bytearray(np.packbits(marks, bitorder="little").tobytes())
+        self.size = count
+
+    def _bounds(self, anchor):
+        # допустимый диапазон значений: явное окно или MAX_DOMAIN от наименьшего значения
+        if self.domain is not None:
+            return self.low, self.low + self.domain
+        if self.bits:
+            top = self.base + 8 * len(self.bits)
+            return top - MAX_DOMAIN, self.base + MAX_DOMAIN
+        return anchor, anchor + MAX_DOMAIN
+
+    @staticmethod
+    def _to_int(item):
+        try:
+            return int(item)
+        except (TypeError, ValueError):
+            print(f"Ошибка: {item} не является целым числом")
+            return None
+
+    def _reject(self, num):
+        if self.domain is not None:
+            print(f"Ошибка: {num} вне диапазона множества [{self.low}, {self.low + self.domain})")
+        else:
+            print(f"Ошибка: {num} слишком далеко от остальных элементов, окно шире {MAX_DOMAIN} чисел")
+
+    @property
+    def elements(self):
+        # все установленные биты разбираются за один векторный проход по карте
+        if not self.size:
+            return []
+        marks = np.unpackbits(np.frombuffer(self.bits, dtype=np.uint8), bitorder="little")
+        offsets = np.flatnonzero(marks)
+        if abs(self.base) < 1 << 62:
+            return (offsets + self.base).tolist()
+        # окно вне int64 сдвигается уже в числах Python
+        return [self.base + offset for offset in offsets.tolist()]
+
+    def __len__(self):
+        return self.size
 
     def __str__(self):
         return f"{self.elements}"
@@ -12,32 +119,107 @@ class IntegerSet:
         return f"IntegerSet(max_size={self.max_size}, elements={self.elements})"
 
     def __eq__(self, other):
-        return self.max_size == other.max_size and self.elements == other.elements
+        return self.max_size == other.max_size and self.size == other.size and self.elements == other.elements
 
     def contains(self, item):
-        return item in self.elements
+        try:
+            offset = as_index(item) - self.base
+        except TypeError:
+            return False
+        return 0 <= offset < 8 * len(self.bits) and bool(self.bits[offset >> 3] >> (offset & 7) & 1)
+
+    def _fits(self, num):
+        low, high = self._bounds(num)
+        return low <= num < high
+
+    def _grow(self, num):
+        # окно расширяется хотя бы на свою длину в сторону num, поэтому серия add амортизированно O(1)
+        low, high = self._bounds(num)
+        top = self.base + 8 * len(self.bits)
+        if not self.bits:
+            self.base = top = _align(num)
+        slack = max(8 * len(self.bits), 64)
+        if num < self.base:
+            start = _align(max(min(num, self.base - slack), low))
+            self.bits[0:0] = bytes((self.base - start) // 8)
+            self.base = start
+        elif num >= top:
+            end = min(max(num + 1, top + slack), high + 7)
+            self.bits.extend(bytes((end - top + 7) // 8))
+
+    def _from_bits(self, max_size, base, bits):
+        result = IntegerSet(max_size)
+        result.base, result.bits = base, bytearray(bits.tobytes())
+        result.size = popcount_buffer(result.bits)
+        result.keep_lowest(max_size)
+        return result
+
+    def keep_lowest(self, count):
+        # оставляет count наименьших элементов: по накопленным весам байтов находится граничный байт
+        if self.size <= count:
+            return
+        view = np.frombuffer(self.bits, dtype=np.uint8)
+        totals = np.cumsum(BYTE_TABLE[view], dtype=np.int64)
+        index = int(np.searchsorted(totals, count))
+        view[index + 1 :] = 0
+        byte = int(view[index])
+        for _ in range(int(totals[index]) - count):
+            byte &= ~(1 << (byte.bit_length() - 1))
+        view[index] = byte
+        del view
+        self.size = count
+
+    def window_bytes(self, start, end):
+        view = np.frombuffer(self.bits, dtype=np.uint8)
+        return view[(start - self.base) // 8 : (end - self.base) // 8]
 
     def union(self, other):
         new_max = max(self.max_size, other.max_size)
-        new_elements = list(set(self.elements + other.elements))[:new_max]
-        return IntegerSet(new_max, new_elements)
+        sets = [item for item in (self, other) if item.bits]
+        if not sets:
+            return IntegerSet(new_max)
+        start = min(item.base for item in sets)
+        end = max(item.base + 8 * len(item.bits) for item in sets)
+        if end - start > max(MAX_DOMAIN, self.domain or 0, other.domain or 0):
+            raise ValueError(f"объединение шире {MAX_DOMAIN} чисел - множества слишком далеко друг от друга")
+        bits = np.zeros((end - start) // 8, dtype=np.uint8)
+        for item in sets:
+            offset = (item.base - start) // 8
+            bits[offset : offset + len(item.bits)] |= np.frombuffer(item.bits, dtype=np.uint8)
+        return self._from_bits(new_max, start, bits)
+
+    def intersection(self, other):
+        new_max = min(self.max_size, other.max_size)
+        start = max(self.base, other.base)
+        end = min(self.base + 8 * len(self.bits), other.base + 8 * len(other.bits))
+        if start >= end:
+            return IntegerSet(new_max)
+        return self._from_bits(new_max, start, self.window_bytes(start, end) & other.window_bytes(start, end))
 
     def add(self, item):
-        try:
-            num = int(item)
-            if num not in self.elements and len(self.elements) < self.max_size:
-                self.elements.append(num)
-            elif num in self.elements:
-                print(f"Элемент {num} уже существует в множестве")
-            else:
-                print(f"Нельзя добавить {num}: достигнута максимальная мощность {self.max_size}")
-        except ValueError:
-            print(f"Ошибка: {item} не является целым числом")
+        num = self._to_int(item)
+        if num is None:
+            return
+        if self.contains(num):
+            print(f"Элемент {num} уже существует в множестве")
+        elif self.size >= self.max_size:
+            print(f"Нельзя добавить {num}: достигнута максимальная мощность {self.max_size}")
+        elif not self._fits(num):
+            self._reject(num)
+        else:
+            offset = num - self.base
+            if not 0 <= offset < 8 * len(self.bits):
+                self._grow(num)
+                offset = num - self.base
+            self.bits[offset >> 3] |= 1 << (offset & 7)
+            self.size += 1
 
     def remove(self, value):
-        try:
-            self.elements.remove(value)
-        except ValueError:
+        if self.contains(value):
+            offset = as_index(value) - self.base
+            self.bits[offset >> 3] &= ~(1 << (offset & 7)) & 0xFF
+            self.size -= 1
+        else:
             print(f"Элемент {value} не найден в множестве")
 
 
@@ -1,9 +1,83 @@
-arr = input("Введите числа через пробел: ").split()
-sizeArr = len(arr)
-for i in range(sizeArr):
-    for j in range(0, sizeArr - i - 1):
-        if arr[j] < arr[j + 1]:
-            temp = arr[j]
-            arr[j] = arr[j + 1]
-            arr[j + 1] = temp
-print(arr)
+import argparse
+import heapq
+import sys
+import tempfile
+from contextlib import ExitStack
+
+BUFFER_SIZE = 1_000_000
+
+
+def to_number(token):
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def read_tokens(lines):
+    for line in lines:
+        yield from line.split()
+
+
+def _spill(run, reverse):
+    run.sort(reverse=reverse)
+    file = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+    file.writelines(f"{value}\n" for value in run)
+    file.seek(0)
+    return file
+
+
+def _read_run(file, convert):
+    for line in file:
+        yield convert(line.rstrip("\n"))
+
+
+def external_sort(tokens, numeric=True, reverse=False, buffer_size=BUFFER_SIZE):
+    # отсортированные куски по buffer_size элементов сбрасываются во временные файлы,
+    # затем сливаются k-путевым слиянием через кучу
+    convert = to_number if numeric else str
+    with ExitStack() as stack:
+        runs = []
+        run = []
+        for token in tokens:
+            run.append(convert(token))
+            if len(run) >= buffer_size:
+                runs.append(stack.enter_context(_spill(run, reverse)))
+                run = []
+        if not runs:
+            # всё поместилось в память - обычная сортировка без файлов
+            run.sort(reverse=reverse)
+            yield from run
+            return
+        if run:
+            runs.append(stack.enter_context(_spill(run, reverse)))
+        yield from heapq.merge(*(_read_run(file, convert) for file in runs), reverse=reverse)
+
+
+def sort_values(tokens, numeric=True, reverse=False, buffer_size=BUFFER_SIZE):
+    return list(external_sort(tokens, numeric, reverse, buffer_size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сортировка чисел или строк, в том числе больше объёма памяти")
+    parser.add_argument("file", nargs="?", help="файл с данными, '-' - стандартный ввод")
+    parser.add_argument("--strings", action="store_true", help="сравнивать как строки")
+    parser.add_argument("--ascending", action="store_true", help="по возрастанию (по умолчанию по убыванию)")
+    parser.add_argument("--buffer", type=int, default=BUFFER_SIZE, help="сколько элементов держать в памяти")
+    args = parser.parse_args()
+
+    numeric = not args.strings
+    reverse = not args.ascending
+    if args.file is None:
+        arr = input("Введите числа через пробел: ").split()
+        print(sort_values(arr, numeric, reverse, args.buffer))
+        return
+
+    with ExitStack() as stack:
+        source = sys.stdin if args.file == "-" else stack.enter_context(open(args.file, encoding="utf-8"))
+        values = external_sort(read_tokens(source), numeric, reverse, args.buffer)
+        sys.stdout.writelines(f"{value}\n" for value in values)
+
+
+if __name__ == "__main__":
+    main()
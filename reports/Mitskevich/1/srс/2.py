@@ -1,20 +1,59 @@
-def factorial(number):
-    resultFactor = 1
-    if number == 0:
-        return resultFactor
-    for i in range(1, number + 1):
-        resultFactor *= i
-    return resultFactor
-
-
-value = int(input("Введите число ступенек: "))
-valueOfBigStep = value // 2
-valueOfLittleStep = value % 2
-result = 0
-while valueOfBigStep >= 0:
-    result += factorial(valueOfLittleStep + valueOfBigStep) // (
-        factorial(valueOfLittleStep) * (factorial(valueOfBigStep))
-    )
-    valueOfBigStep -= 1
-    valueOfLittleStep += 2
-print(f"Результат: {result}")
+TABLE_SIZE = 1024
+
+# число способов подняться на n ступенек шагами 1 и 2 - это число Фибоначчи F(n + 1)
+smallTable = [0, 1]
+for index in range(2, TABLE_SIZE + 2):
+    smallTable.append(smallTable[-1] + smallTable[-2])
+
+
+def fibonacciPair(number, modulus=None):
+    # быстрое удвоение: F(2k) = F(k) * (2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+    if number <= TABLE_SIZE:
+        pair = (smallTable[number], smallTable[number + 1])
+        return pair if modulus is None else (pair[0] % modulus, pair[1] % modulus)
+    first, second = 0, 1
+    for bit in bin(number)[2:]:
+        double = first * (2 * second - first)
+        doubleNext = first * first + second * second
+        if modulus is not None:
+            double %= modulus
+            doubleNext %= modulus
+        if bit == "1":
+            first, second = doubleNext, double + doubleNext
+            if modulus is not None:
+                second %= modulus
+        else:
+            first, second = double, doubleNext
+    return first, second
+
+
+def countWays(value, modulus=None):
+    if value < 0:
+        raise ValueError("Число ступенек не может быть отрицательным")
+    return fibonacciPair(value, modulus)[1]
+
+
+def countWaysBatch(values, modulus=None):
+    # идём по возрастанию n и сдвигаемся от предыдущего ответа на разницу:
+    # F(a+d) = F(a+1)F(d) + F(a)(F(d+1) - F(d)), F(a+d+1) = F(a+1)F(d+1) + F(a)F(d)
+    results = {}
+    current, first, second = 0, 0, 1
+    for value in sorted(set(values)):
+        if value < 0:
+            raise ValueError("Число ступенек не может быть отрицательным")
+        stepFirst, stepSecond = fibonacciPair(value + 1 - current, modulus)
+        first, second = (
+            second * stepFirst + first * (stepSecond - stepFirst),
+            second * stepSecond + first * stepFirst,
+        )
+        if modulus is not None:
+            first %= modulus
+            second %= modulus
+        current = value + 1
+        results[value] = first
+    return [results[value] for value in values]
+
+
+if __name__ == "__main__":
+    steps = int(input("Введите число ступенек: "))
+    print(f"Результат: {countWays(steps)}")
@@ -1,8 +1,82 @@
+import argparse
 import random
+import sys
+import tempfile
+from contextlib import ExitStack
+from itertools import islice
 
-numbers = input("Введите числа через пробел: ").split()
-numbers = [int(x) for x in numbers]
+import numpy as np
 
-random.shuffle(numbers)
+BLOCK_LINES = 1 << 16
 
-print("Числа в случайном порядке:", *numbers)
+
+def shuffle_array(values, seed=None):
+    # Фишер-Йетс на массиве NumPy, воспроизводимый по seed
+    values = np.array(values)
+    np.random.default_rng(seed).shuffle(values)
+    return values
+
+
+def external_shuffle(lines, target, seed=None, buckets=64):
+    # первый проход раскладывает записи по случайным временным файлам,
+    # второй перемешивает каждый файл в памяти и выводит их по очереди
+    rng = np.random.default_rng(seed)
+    lines = iter(lines)
+    with ExitStack() as stack:
+        files = [stack.enter_context(tempfile.TemporaryFile(mode="w+b")) for _ in range(buckets)]
+        while True:
+            block = list(islice(lines, BLOCK_LINES))
+            if not block:
+                break
+            for line, bucket in zip(block, rng.integers(0, buckets, size=len(block)).tolist()):
+                files[bucket].write(line if line.endswith(b"\n") else line + b"\n")
+        for file in files:
+            file.seek(0)
+            records = file.readlines()
+            order = rng.permutation(len(records))
+            target.writelines(records[index] for index in order.tolist())
+
+
+def shuffle_buffer(items, buffer_size=BLOCK_LINES, seed=None):
+    # потоковое перемешивание с буфером фиксированного размера: каждый новый элемент
+    # занимает место случайного элемента буфера, а вытесненный уходит на выход
+    rng = random.Random(seed)
+    buffer = []
+    for item in items:
+        if len(buffer) < buffer_size:
+            buffer.append(item)
+            continue
+        index = rng.randrange(buffer_size)
+        yield buffer[index]
+        buffer[index] = item
+    rng.shuffle(buffer)
+    yield from buffer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Воспроизводимое перемешивание строк")
+    parser.add_argument("file", nargs="?", help="файл со строками, '-' - стандартный ввод")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--mode", choices=["external", "buffer"], default="external")
+    parser.add_argument("--buckets", type=int, default=64, help="число временных файлов")
+    parser.add_argument("--buffer", type=int, default=BLOCK_LINES, help="размер буфера в строках")
+    args = parser.parse_args()
+
+    if args.file is None:
+        numbers = input("Введите числа через пробел: ").split()
+        numbers = [int(x) for x in numbers]
+        print("Числа в случайном порядке:", *shuffle_array(numbers, args.seed).tolist())
+        return
+
+    with ExitStack() as stack:
+        source = sys.stdin.buffer if args.file == "-" else stack.enter_context(open(args.file, "rb"))
+        target = sys.stdout.buffer
+        if args.mode == "external":
+            external_shuffle(source, target, args.seed, args.buckets)
+        else:
+            lines = (line if line.endswith(b"\n") else line + b"\n" for line in source)
+            target.writelines(shuffle_buffer(lines, args.buffer, args.seed))
+
+
+if __name__ == "__main__":
+    main()
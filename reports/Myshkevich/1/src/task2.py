@@ -1,23 +1,112 @@
-from collections import Counter
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
 
 
-def find_majority_element(arr):
-    counts = Counter(arr)
-    n = len(arr)
+def majority_candidate(arr):
+    # Бойер-Мур: один проход, O(1) памяти
+    candidate, count = None, 0
+    for num in arr:
+        if count == 0:
+            candidate = num
+        count += 1 if num == candidate else -1
+    return candidate
 
-    for num, freq in counts.items():
-        if freq > n // 2:
-            return num
 
+def find_majority_element(arr):
+    # второй проход подтверждает кандидата; arr должен допускать повторный обход
+    candidate = majority_candidate(arr)
+    n = 0
+    freq = 0
+    for num in arr:
+        n += 1
+        if num == candidate:
+            freq += 1
+    if n and freq > n // 2:
+        return candidate
     return None
 
 
-input_str = input("Введите числа через пробел: ")
-nums = list(map(int, input_str.split()))
+class MisraGries:
+    # Не больше k - 1 счётчиков; каждый элемент с частотой > n / k гарантированно останется в таблице,
+    # недосчёт любого счётчика не больше n / k
+    def __init__(self, k, counters=None):
+        if k < 2:
+            raise ValueError("k должно быть не меньше 2")
+        self.k = k
+        self.counters = dict(counters or {})
+        self.total = 0
+
+    def add(self, item, count=1):
+        self.total += count
+        self.counters[item] = self.counters.get(item, 0) + count
+        self._shrink()
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+        return self
+
+    def _shrink(self):
+        # вычитаем k-й по величине счётчик, остаётся не больше k - 1 положительных
+        if len(self.counters) < self.k:
+            return
+        cut = sorted(self.counters.values(), reverse=True)[self.k - 1]
+        self.counters = {item: count - cut for item, count in self.counters.items() if count > cut}
+
+    def merge(self, other):
+        # слияние ассоциативно, поэтому сводки кусков можно объединять в любом порядке
+        merged = MisraGries(max(self.k, other.k), self.counters)
+        for item, count in other.counters.items():
+            merged.add(item, count)
+        merged.total = self.total + other.total
+        return merged
+
+    def top(self, limit=None):
+        return sorted(self.counters.items(), key=lambda pair: pair[1], reverse=True)[:limit]
+
+
+def heavy_hitters(arr, k):
+    return MisraGries(k).update(arr).top()
+
+
+def _chunks(arr, size):
+    iterator = iter(arr)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _summarize(task):
+    k, chunk = task
+    return MisraGries(k).update(chunk)
+
+
+def parallel_heavy_hitters(arr, k, workers=None, chunk_size=1_000_000):
+    # в работе не больше двух кусков на процесс: поток читается по мере готовности сводок,
+    # и каждая сводка сливается сразу, так что память не растёт с длиной arr
+    workers = workers or os.cpu_count() or 1
+    summary = MisraGries(k)
+    chunks = _chunks(arr, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_summarize, (k, chunk)) for chunk in islice(chunks, 2 * workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                summary = summary.merge(future.result())
+            pending |= {pool.submit(_summarize, (k, chunk)) for chunk in islice(chunks, len(done))}
+    return summary.top()
+
+
+if __name__ == "__main__":
+    input_str = input("Введите числа через пробел: ")
+    nums = list(map(int, input_str.split()))
 
-result = find_majority_element(nums)
+    result = find_majority_element(nums)
 
-if result is not None:
-    print(f"Элемент большинства: {result}")
-else:
-    print("Элемент большинства не найден")
+    if result is not None:
+        print(f"Элемент большинства: {result}")
+    else:
+        print("Элемент большинства не найден")
@@ -0,0 +1,95 @@
+"""Десятичный счётчик в bytearray: цифры хранятся с младшей, поэтому перенос в новый разряд - это append"""
+
+import numpy as np
+
+TO_DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+TO_TEXT = bytes.maketrans(bytes(range(10)), b"0123456789")
+
+
+class DigitCounter:
+    def __init__(self, value=0):
+        if isinstance(value, int):
+            value = str(value)
+        text = value.strip().encode("ascii")
+        if not text.isdigit():
+            raise ValueError(f"ожидается неотрицательное целое число: {value!r}")
+        # цифры от младшей к старшей, каждая - байт 0..9
+        self.digits = bytearray(text.lstrip(b"0")[::-1].translate(TO_DIGITS)) or bytearray(1)
+
+    @classmethod
+    def from_digits(cls, digits):
+        counter = cls()
+        counter.digits = bytearray(reversed(bytes(digits).lstrip(b"\0"))) or bytearray(1)
+        return counter
+
+    def __str__(self):
+        return self.digits[::-1].translate(TO_TEXT).decode("ascii")
+
+    def __repr__(self):
+        return f"DigitCounter({self})"
+
+    def __int__(self):
+        return int(str(self))
+
+    def __len__(self):
+        return len(self.digits)
+
+    def __eq__(self, other):
+        if not isinstance(other, DigitCounter):
+            return NotImplemented
+        return self.digits == other.digits
+
+    def to_list(self, width=0):
+        # width - минимальная длина списка: ведущие нули исходной записи дописываются слева
+        digits = list(self.digits[::-1])
+        return [0] * (width - len(digits)) + digits
+
+    def increment(self):
+        # амортизированно O(1): длинная цепочка девяток обнуляется редко
+        digits = self.digits
+        position = 0
+        while position < len(digits) and digits[position] == 9:
+            digits[position] = 0
+            position += 1
+        if position == len(digits):
+            digits.append(1)
+        else:
+            digits[position] += 1
+        return self
+
+    def add(self, amount):
+        if amount < 0:
+            raise ValueError("счётчик только растёт")
+        digits = self.digits
+        position, carry = 0, 0
+        while amount or carry:
+            amount, digit = divmod(amount, 10)
+            if position == len(digits):
+                digits.append(0)
+            carry, digits[position] = divmod(digits[position] + digit + carry, 10)
+            position += 1
+        return self
+
+
+def increment_many(matrix):
+    # двумерный uint8 массив: строка - счётчик, столбцы - цифры от старшей к младшей.
+    # Хвостовые девятки обнуляются, следующая слева цифра растёт; возвращает флаги переполнения
+    nines = np.cumprod(matrix[:, ::-1] == 9, axis=1).sum(axis=1)
+    width = matrix.shape[1]
+    matrix[np.arange(width) >= width - nines[:, None]] = 0
+    overflow = nines == width
+    rows = np.flatnonzero(~overflow)
+    matrix[rows, width - 1 - nines[rows]] += 1
+    return overflow
+
+
+def add_many(matrix, amounts):
+    # перенос распространяется столбец за столбцом, но сразу по всем строкам
+    amounts = np.array(np.broadcast_to(amounts, matrix.shape[:1]), dtype=np.int64)
+    carry = np.zeros(matrix.shape[0], dtype=np.int64)
+    for column in range(matrix.shape[1] - 1, -1, -1):
+        total = matrix[:, column] + amounts % 10 + carry
+        matrix[:, column] = total % 10
+        carry = total // 10
+        amounts //= 10
+    return (carry + amounts) > 0
@@ -0,0 +1,124 @@
+"""Медиана тремя способами: потоковая на двух кучах, quickselect и KLL-скетч для бесконечных потоков"""
+
+import heapq
+import math
+import random
+
+
+class RunningMedian:
+    """Точная медиана потока: нижняя половина в max-куче, верхняя в min-куче"""
+
+    def __init__(self, values=()):
+        self.lower = []
+        self.upper = []
+        for value in values:
+            self.add(value)
+
+    def __len__(self):
+        return len(self.lower) + len(self.upper)
+
+    def add(self, value):
+        if self.lower and value > -self.lower[0]:
+            heapq.heappush(self.upper, value)
+        else:
+            heapq.heappush(self.lower, -value)
+        if len(self.lower) > len(self.upper) + 1:
+            heapq.heappush(self.upper, -heapq.heappop(self.lower))
+        elif len(self.upper) > len(self.lower):
+            heapq.heappush(self.lower, -heapq.heappop(self.upper))
+
+    @property
+    def median(self):
+        if not self.lower:
+            raise ValueError("медиана пустой последовательности не определена")
+        if len(self.lower) > len(self.upper):
+            return -self.lower[0]
+        return (-self.lower[0] + self.upper[0]) / 2
+
+
+def running_medians(values):
+    stream = RunningMedian()
+    for value in values:
+        stream.add(value)
+        yield stream.median
+
+
+def quickselect(values, k, seed=None):
+    """k-я порядковая статистика (с нуля) за ожидаемое O(n)"""
+    if not 0 <= k < len(values):
+        raise IndexError("k вне диапазона")
+    rng = random.Random(seed)
+    items = list(values)
+    while True:
+        pivot = items[rng.randrange(len(items))]
+        less = [x for x in items if x < pivot]
+        if k < len(less):
+            items = less
+            continue
+        equal = sum(1 for x in items if x == pivot)
+        if k < len(less) + equal:
+            return pivot
+        k -= len(less) + equal
+        items = [x for x in items if x > pivot]
+
+
+def median(values):
+    size = len(values)
+    if size == 0:
+        raise ValueError("медиана пустой последовательности не определена")
+    if size % 2:
+        return quickselect(values, size // 2)
+    return (quickselect(values, size // 2 - 1) + quickselect(values, size // 2)) / 2
+
+
+class KLLSketch:
+    """Приближённые квантили в ограниченной памяти: ошибка ранга порядка epsilon * n"""
+
+    def __init__(self, epsilon=0.01, seed=None):
+        self.k = max(8, math.ceil(1.7 / epsilon))
+        self.levels = [[]]
+        self.count = 0
+        self.rng = random.Random(seed)
+
+    def __len__(self):
+        return self.count
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append([])
+                items.sort()
+                # при нечётной длине один элемент остаётся на уровне, чтобы не терять вес
+                keep = [items.pop()] if len(items) % 2 else []
+                self.levels[level + 1].extend(items[self.rng.randrange(2) :: 2])
+                self.levels[level] = keep
+            level += 1
+
+    def add(self, value):
+        self.levels[0].append(value)
+        self.count += 1
+        if len(self.levels[0]) >= self._capacity(0):
+            self._compress()
+
+    def quantile(self, fraction):
+        if not self.count:
+            raise ValueError("квантиль пустой последовательности не определён")
+        weighted = sorted((value, 1 << level) for level, items in enumerate(self.levels) for value in items)
+        target = fraction * self.count
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return value
+        return weighted[-1][0]
+
+    @property
+    def median(self):
+        return self.quantile(0.5)
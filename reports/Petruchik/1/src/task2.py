@@ -1,12 +1,8 @@
 ﻿""""Всем привет, это моя вторая программа(меня  заставил это написать pylint)"""
-digits = list(map(int, input().split()))
 
-for i in range(len(digits)-1, -1, -1):
-    if digits[i] < 9:
-        digits[i] += 1
-        print(digits)
-        break
-    digits[i] = 0
-else:
-    digits = [1] + digits
-    print(digits)
+from digit_counter import DigitCounter
+
+digits = input().split()
+
+# пустой ввод - это ноль, а ширина ввода сохраняется вместе с ведущими нулями
+print(DigitCounter("".join(digits) or "0").increment().to_list(len(digits)))
@@ -1,8 +1,16 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.distinct import unique_sorted  # pylint: disable=wrong-import-position
+from common.reader import read_ints  # pylint: disable=wrong-import-position
+
+
 def unique_numbers():
-    n = int(input())
-    elements = list(map(int, input().split()))[:n]
-    unique_elements = sorted(set(elements))
-    print(*unique_elements)
+    values = read_ints()
+    n = int(values[0])
+    elements = values[1 : 1 + n]
+    print(*unique_sorted(elements))
 
 
 if __name__ == "__main__":
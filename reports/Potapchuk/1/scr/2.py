@@ -1,11 +1,15 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.binary import add_binary  # pylint: disable=wrong-import-position
+
+
 def binary_sum():
     a = input().strip()
     b = input().strip()
 
-    num_a = int(a, 2)
-    num_b = int(b, 2)
-
-    result = bin(num_a + num_b)[2:]
+    result = add_binary(a, b)
     print(result)
 
 
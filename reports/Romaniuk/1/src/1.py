@@ -1,12 +1,13 @@
-numbers = input("Введите числа: ").split()
-a = b = c = 0
-for n in numbers:
-    if int(n) < 10 and int(n) > -10:
-        a += 1
-    elif int(n) < 100 and int(n) > -100:
-        b += 1
-    elif int(n) < 1000 and int(n) > -1000:
-        c += 1
-print("Однозначных:", a)
-print("Двузначных:", b)
-print("Трехзначных:", c)
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.digits import histogram_from_buffer  # pylint: disable=wrong-import-position
+
+dist = histogram_from_buffer(input("Введите числа: "))
+print("Однозначных:", dist.get(1, 0))
+print("Двузначных:", dist.get(2, 0))
+print("Трехзначных:", dist.get(3, 0))
+for digits in sorted(dist):
+    if digits > 3:
+        print(f"{digits}-значных:", dist[digits])
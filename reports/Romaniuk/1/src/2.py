@@ -1,15 +1,14 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.popcount import popcount  # pylint: disable=wrong-import-position
+
 while True:
     text = input("Input: ")
     if text == "":
         break
 
     number = int(text)
-    binary = bin(number)
-
-    count = 0
-    for symbol in binary:
-        if symbol == "1":
-            count = count + 1
-
-    print("Output:", count)
+    print("Output:", popcount(number))
     print()
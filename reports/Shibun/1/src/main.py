@@ -1,13 +1,26 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.distinct import unique_sorted  # pylint: disable=wrong-import-position
+from common.reader import is_interactive, read_ints  # pylint: disable=wrong-import-position
+
+
 def uniq_numbers(param):
-    uniq = set(param)
+    uniq = list(unique_sorted(param))
     return uniq
 
 
-N = int(input("Введите кол-во чисел: "))
-numbers = []
+if is_interactive():
+    N = int(input("Введите кол-во чисел: "))
+    numbers = []
 
-for i in range(N):
-    num = int(input(f"Введите число {i+1}: "))
-    numbers.append(num)
+    for i in range(N):
+        num = int(input(f"Введите число {i+1}: "))
+        numbers.append(num)
+else:
+    values = read_ints()
+    N = int(values[0])
+    numbers = values[1 : 1 + N]
 
 print("Уникальные числа: ", uniq_numbers(numbers))
@@ -1,5 +1,12 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.binary import add_binary  # pylint: disable=wrong-import-position
+
+
 def addBinary(a: str, b: str) -> str:
-    return bin(int(a, 2) + int(b, 2))[2:]
+    return add_binary(a, b)
 
 
 print(addBinary("11", "1"))  # 100
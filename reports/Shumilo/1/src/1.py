@@ -1,3 +1,9 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.digits import digit_histogram  # pylint: disable=wrong-import-position
+
 while True:
     raw = input("Введите числа через пробел: ").split()
     nums = []
@@ -13,12 +19,7 @@ while True:
     if ok:
         break
 
-dist = {}
-for n in nums:
-    digits = len(str(abs(n)))
-    if digits not in dist:
-        dist[digits] = 0
-    dist[digits] += 1
+dist = digit_histogram(nums)
 
 print("\nРаспределение по количеству цифр:")
 for digits in sorted(dist):
@@ -1,5 +1,12 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.popcount import popcount  # pylint: disable=wrong-import-position
+
+
 def hamming_weight(x: int) -> int:
-    return bin(x).count("1")
+    return popcount(x)
 
 
 while True:
@@ -1,6 +1,11 @@
-numbers = []
-items = int(input())
-for i in range(items):
-    number = int(input())
-    numbers.append(number)
-print(max(numbers) - min(numbers))
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.reader import read_ints  # pylint: disable=wrong-import-position
+from common.spread import min_max  # pylint: disable=wrong-import-position
+
+values = read_ints()
+items = int(values[0])
+low, high = min_max(values[1 : 1 + items])
+print(high - low)
@@ -1,3 +1,7 @@
+import random
+import timeit
+
+
 def longestCommonPrefix(strs):
     if not strs:
         return ""
@@ -12,3 +16,126 @@ def longestCommonPrefix(strs):
         word += ch
 
     return word
+
+
+def common_length(first, second):
+    # бинарный поиск по срезам: сравнение срезов идёт на уровне C, без посимвольного цикла
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if first[:mid] == second[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def common_prefix(strings):
+    # один проход: префикс только укорачивается, как только он пуст - дальше не читаем
+    iterator = iter(strings)
+    prefix = next(iterator, None)
+    if prefix is None:
+        return ""
+
+    for word in iterator:
+        if not word.startswith(prefix):
+            prefix = prefix[: common_length(prefix, word)]
+            if not prefix:
+                break
+
+    return prefix
+
+
+def common_prefix_file(path, encoding="utf-8"):
+    with open(path, encoding=encoding) as file:
+        return common_prefix(line.rstrip("\r\n") for line in file)
+
+
+class _Node:
+    __slots__ = ("children", "terminal")
+
+    def __init__(self):
+        self.children = {}
+        self.terminal = False
+
+
+class PrefixTrie:
+    # сжатое префиксное дерево: ребро хранит строку, у нетерминального узла всегда >= 2 детей,
+    # поэтому общий префикс подмножества находится сразу после спуска по P
+    def __init__(self, strings=()):
+        self.root = _Node()
+        self.size = 0
+        for word in strings:
+            self.insert(word)
+
+    def __len__(self):
+        return self.size
+
+    def insert(self, word):
+        node = self.root
+        rest = word
+        while rest:
+            edge = node.children.get(rest[0])
+            if edge is None:
+                leaf = _Node()
+                leaf.terminal = True
+                node.children[rest[0]] = (rest, leaf)
+                self.size += 1
+                return
+            label, child = edge
+            length = common_length(label, rest)
+            if length < len(label):
+                middle = _Node()
+                middle.children[label[length]] = (label[length:], child)
+                node.children[rest[0]] = (label[:length], middle)
+                child = middle
+            node = child
+            rest = rest[length:]
+        if not node.terminal:
+            node.terminal = True
+            self.size += 1
+
+    def common_prefix(self, prefix=""):
+        # LCP всех строк, начинающихся с prefix; None, если таких строк нет
+        if not self.size:
+            return None
+        node = self.root
+        rest = prefix
+        tail = ""
+        while rest:
+            edge = node.children.get(rest[0])
+            if edge is None:
+                return None
+            label, child = edge
+            if len(rest) <= len(label):
+                if not label.startswith(rest):
+                    return None
+                tail = label[len(rest) :]
+                node = child
+                break
+            if not rest.startswith(label):
+                return None
+            node = child
+            rest = rest[len(label) :]
+        if not node.terminal and len(node.children) == 1:
+            label, _ = next(iter(node.children.values()))
+            tail += label
+        return prefix + tail
+
+
+def benchmark(count=200_000, repeat=3):
+    rng = random.Random(0)
+    base = "https://example.com/api/v1/resources/"
+    corpus = [base + str(rng.randrange(10**9)) for _ in range(count)]
+
+    old = min(timeit.repeat(lambda: longestCommonPrefix(corpus), number=1, repeat=repeat))
+    new = min(timeit.repeat(lambda: common_prefix(corpus), number=1, repeat=repeat))
+    assert longestCommonPrefix(corpus) == common_prefix(corpus)
+
+    print(f"strings: {count}, prefix: {common_prefix(corpus)!r}")
+    print(f"longestCommonPrefix: {old:.4f} s")
+    print(f"common_prefix:       {new:.4f} s ({old / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,152 @@
+"""Сложение больших двоичных строк кусками, без перевода всего операнда в int.
+
+Запуск как модуля складывает два файла с двоичными числами, не загружая их целиком:
+    python -m common.binary a.txt b.txt sum.txt
+    python -m common.binary --benchmark
+"""
+
+import mmap
+import os
+import sys
+import tempfile
+import time
+
+CHUNK_DIGITS = 1 << 16
+WHITESPACE = b" \t\r\n"
+
+
+def _add_into(first, second, target, width, chunk_digits=CHUNK_DIGITS):
+    # складываем с младших разрядов: кусок каждого операнда -> int, сумма -> обратно в цифры;
+    # target - буфер ровно на width цифр, перенос из старшего разряда возвращается
+    carry = 0
+    for end in range(width, 0, -chunk_digits):
+        start = max(end - chunk_digits, 0)
+        size = end - start
+        left = first[max(len(first) - width + start, 0) : max(len(first) - width + end, 0)]
+        right = second[max(len(second) - width + start, 0) : max(len(second) - width + end, 0)]
+        total = int(bytes(left) or b"0", 2) + int(bytes(right) or b"0", 2) + carry
+        carry = total >> size
+        target[start:end] = format(total & ((1 << size) - 1), f"0{size}b").encode()
+    return carry
+
+
+def add_binary(first, second, chunk_digits=CHUNK_DIGITS):
+    first = memoryview(first.encode() if isinstance(first, str) else first)
+    second = memoryview(second.encode() if isinstance(second, str) else second)
+    width = max(len(first), len(second))
+    target = bytearray(width + 1)
+    with memoryview(target) as window:
+        carry = _add_into(first, second, window[1:], width, chunk_digits)
+    target[0:1] = b"1" if carry else b"0"
+    # как у bin(int(a, 2) + int(b, 2)): без ведущих нулей
+    return (target.lstrip(b"0") or b"0").decode()
+
+
+def sum_binary(numbers, chunk_digits=CHUNK_DIGITS):
+    # попарное сложение деревом: операнды на каждом уровне растут равномерно
+    numbers = list(numbers)
+    if not numbers:
+        return "0"
+    while len(numbers) > 1:
+        paired = [add_binary(left, right, chunk_digits) for left, right in zip(numbers[::2], numbers[1::2])]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+    return add_binary(numbers[0], "0", chunk_digits)
+
+
+def _strip_end(view):
+    end = len(view)
+    while end and view[end - 1] in WHITESPACE:
+        end -= 1
+    return view[:end]
+
+
+def _carry_out(first, second, width, chunk_digits=CHUNK_DIGITS):
+    # перенос из старшего разряда виден по первой сверху позиции, где цифры совпадают:
+    # две единицы дают перенос, два нуля его гасят; остальные разряды его лишь передают
+    for start in range(0, width, chunk_digits):
+        end = min(start + chunk_digits, width)
+        left = first[max(len(first) - width + start, 0) : max(len(first) - width + end, 0)]
+        right = second[max(len(second) - width + start, 0) : max(len(second) - width + end, 0)]
+        left, right = int(bytes(left) or b"0", 2), int(bytes(right) or b"0", 2)
+        same = ~(left ^ right) & ((1 << (end - start)) - 1)
+        if same:
+            return bool(left >> (same.bit_length() - 1) & 1)
+    return False
+
+
+def _map(file):
+    if os.fstat(file.fileno()).st_size == 0:
+        return b""
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def add_binary_files(first_path, second_path, target_path, chunk_digits=CHUNK_DIGITS):
+    # файлы отображаются в память и читаются с конца; результат пишется в заранее
+    # размеченный файл тоже с конца. Ширина результата - ширина длинного операнда
+    # (его ведущие нули сохраняются) плюс старшая единица, если был перенос
+    with open(first_path, "rb") as first_file, open(second_path, "rb") as second_file:
+        first_map, second_map = _map(first_file), _map(second_file)
+        first = _strip_end(memoryview(first_map))
+        second = _strip_end(memoryview(second_map))
+        width = max(len(first), len(second))
+        carry = int(_carry_out(first, second, width, chunk_digits))
+        size = max(width + carry, 1)
+        with open(target_path, "w+b") as file:
+            file.truncate(size + 1)
+            with mmap.mmap(file.fileno(), 0) as target:
+                with memoryview(target) as window:
+                    _add_into(first, second, window[carry : carry + width], width, chunk_digits)
+                if carry or not width:
+                    target[0:1] = b"1" if carry else b"0"
+                target[size : size + 1] = b"\n"
+        first.release()
+        second.release()
+        for mapped in (first_map, second_map):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+    return size
+
+
+def _write_operand(path, digits):
+    with open(path, "wb") as file:
+        file.write(b"1")
+        for start in range(1, digits, CHUNK_DIGITS * 16):
+            block = min(CHUNK_DIGITS * 16, digits - start)
+            digits_block = format(int.from_bytes(os.urandom((block + 7) // 8), "big"), "b")
+            file.write(digits_block[:block].rjust(block, "0").encode())
+
+
+def benchmark(sizes=(1 << 20, 100 << 20, 1 << 30), in_memory_limit=100 << 20):
+    with tempfile.TemporaryDirectory() as directory:
+        first_path, second_path, target_path = (os.path.join(directory, name) for name in ("a", "b", "sum"))
+        for size in sizes:
+            _write_operand(first_path, size)
+            _write_operand(second_path, size)
+            start = time.perf_counter()
+            add_binary_files(first_path, second_path, target_path)
+            elapsed = time.perf_counter() - start
+            line = f"{size >> 20:>5} MB  files: {elapsed:8.3f} s ({size / elapsed / (1 << 20):8.1f} MB/s)"
+            if size <= in_memory_limit:
+                with open(first_path, "rb") as file:
+                    first = file.read()
+                with open(second_path, "rb") as file:
+                    second = file.read()
+                start = time.perf_counter()
+                add_binary(first, second)
+                chunked = time.perf_counter() - start
+                start = time.perf_counter()
+                bin(int(first, 2) + int(second, 2))
+                plain = time.perf_counter() - start
+                line += f"  add_binary: {chunked:8.3f} s  int/bin: {plain:8.3f} s"
+            print(line)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--benchmark"]:
+        benchmark()
+    elif len(sys.argv) == 4:
+        add_binary_files(*sys.argv[1:])
+    else:
+        print("usage: python -m common.binary A B SUM | --benchmark")
@@ -0,0 +1,52 @@
+"""Распределение целых чисел по количеству цифр за один векторный проход."""
+
+import numpy as np
+
+# 10, 100, ..., 10 ** 19 - все степени десяти, которые помещаются в uint64
+POWERS = np.array([10**power for power in range(1, 20)], dtype=np.uint64)
+_LIMITS = (np.iinfo(np.int64).min, np.iinfo(np.int64).max)
+
+
+def _magnitude(values: np.ndarray) -> np.ndarray:
+    # модуль без переполнения на int64.min: дополнительный код в uint64
+    magnitude = values.astype(np.uint64)
+    negative = values < 0
+    magnitude[negative] = ~magnitude[negative] + np.uint64(1)
+    return magnitude
+
+
+def digit_lengths(values) -> np.ndarray:
+    values = np.asarray(values, dtype=np.int64)
+    return np.searchsorted(POWERS, _magnitude(values), side="right") + 1
+
+
+def _histogram(lengths) -> dict:
+    counts = np.bincount(lengths)
+    return {int(length): int(counts[length]) for length in np.flatnonzero(counts)}
+
+
+def digit_histogram(values) -> dict:
+    try:
+        values = np.asarray(values, dtype=np.int64)
+    except OverflowError:
+        return _histogram([len(str(abs(int(value)))) for value in values])
+    return _histogram(digit_lengths(values))
+
+
+def histogram_from_buffer(buffer) -> dict:
+    # весь буфер разбирается одним вызовом np.fromstring; он молча насыщает числа вне int64,
+    # поэтому при встрече границ диапазона пересчитываем через int() по токенам
+    if isinstance(buffer, (bytes, bytearray, memoryview)):
+        buffer = bytes(buffer).decode("ascii")
+    if not buffer.strip():
+        # из одних пробелов np.fromstring делает [0] - пустой ввод даёт пустое распределение
+        return {}
+    values = np.fromstring(buffer, dtype=np.int64, sep=" ")
+    if values.size and (values.min() == _LIMITS[0] or values.max() == _LIMITS[1]):
+        return _histogram([len(str(abs(int(token)))) for token in buffer.split()])
+    return _histogram(digit_lengths(values))
+
+
+def histogram_from_file(path) -> dict:
+    with open(path, encoding="ascii") as file:
+        return histogram_from_buffer(file.read())
@@ -0,0 +1,199 @@
+"""Уникальные целые числа: np.unique в памяти, разбиение по хешу на диск, оценка количества HyperLogLog."""
+
+import hashlib
+import heapq
+import os
+import tempfile
+from contextlib import ExitStack
+from itertools import islice
+
+import numpy as np
+
+MEMORY_ITEMS = 1 << 24
+BLOCK_ITEMS = 1 << 20
+GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_LIMITS = (np.iinfo(np.int64).min, np.iinfo(np.int64).max)
+
+
+def _mix(values: np.ndarray, salt: int = 0) -> np.ndarray:
+    # splitmix64: хорошо перемешивает и соседние числа; другая соль - другое разбиение
+    with np.errstate(over="ignore"):
+        mixed = values.astype(np.uint64) + GOLDEN * np.uint64(salt + 1)
+        mixed = (mixed ^ (mixed >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        mixed = (mixed ^ (mixed >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return mixed ^ (mixed >> np.uint64(31))
+
+
+def _blocks(values, size):
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        for start in range(0, values.shape[0], size):
+            yield values[start : start + size].astype(np.int64, copy=False)
+        return
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        try:
+            yield np.array(chunk, dtype=np.int64)
+        except OverflowError:
+            # числа шире 64 бит остаются числами Python: np.unique сортирует и такие
+            yield np.array(chunk, dtype=object)
+
+
+def _file_blocks(path, block_items=BLOCK_ITEMS):
+    with open(path, "rb") as file:
+        while True:
+            block = np.fromfile(file, dtype=np.int64, count=block_items)
+            if not block.size:
+                return
+            yield block
+
+
+def _read_file(path, block_items=BLOCK_ITEMS):
+    for block in _file_blocks(path, block_items):
+        yield from block.tolist()
+
+
+def _split_wide(block, wide):
+    # числа вне int64 не пишутся в файлы разбиения, а копятся в множестве wide - их обычно единицы
+    if block.dtype != object:
+        return block
+    narrow = []
+    for value in block.tolist():
+        if _LIMITS[0] <= value <= _LIMITS[1]:
+            narrow.append(value)
+        else:
+            wide.add(value)
+    return np.array(narrow, dtype=np.int64)
+
+
+def unique_sorted(values, memory_items=MEMORY_ITEMS, partitions=64, directory=None):
+    """Отсортированные уникальные значения (генератор int).
+
+    Пока различных значений не больше memory_items, всё решает np.unique. Дальше числа раскладываются
+    по partitions файлам по хешу: одинаковые значения всегда попадают в один файл, каждый файл
+    отдельно проходит через np.unique, а непересекающиеся результаты сливаются через кучу.
+    Файл, который сам больше memory_items, разбивается так же рекурсивно, с другой солью хеша.
+    Числа шире 64 бит сортируются точно, как int Python.
+    """
+    return _unique_blocks(_blocks(values, min(BLOCK_ITEMS, memory_items)), memory_items, partitions, directory, 0)
+
+
+def _unique_blocks(blocks, memory_items, partitions, directory, salt):
+    # в памяти копятся блоки; при переполнении они сжимаются np.unique, и если различных
+    # всё ещё больше половины memory_items, данные уходят на диск
+    buffered, count = [], 0
+    for block in blocks:
+        buffered.append(block)
+        count += block.size
+        if count > memory_items:
+            buffered = [np.unique(np.concatenate(buffered))]
+            count = buffered[0].size
+            if count > memory_items // 2:
+                break
+    else:
+        if buffered:
+            yield from np.unique(np.concatenate(buffered)).tolist()
+        return
+
+    wide = set()
+    with tempfile.TemporaryDirectory(dir=directory) as folder:
+        paths = [os.path.join(folder, f"{index}.bin") for index in range(partitions)]
+        _partition(_chain(buffered, blocks), paths, salt, wide)
+        sources = [_partition_values(path, memory_items, partitions, directory, salt) for path in paths]
+        wide = sorted(wide)
+        yield from (value for value in wide if value < 0)
+        yield from heapq.merge(*sources)
+        yield from (value for value in wide if value > 0)
+
+
+def _partition(blocks, paths, salt, wide):
+    partitions = len(paths)
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(path, "wb")) for path in paths]
+        for block in blocks:
+            block = np.unique(_split_wide(block, wide))
+            owner = (_mix(block, salt) % np.uint64(partitions)).astype(np.intp)
+            order = np.argsort(owner, kind="stable")
+            bounds = np.searchsorted(owner[order], np.arange(partitions + 1))
+            for index in range(partitions):
+                block[order[bounds[index] : bounds[index + 1]]].tofile(files[index])
+
+
+def _partition_values(path, memory_items, partitions, directory, salt):
+    # файл, который не помещается в memory_items, разбивается дальше с новой солью
+    if os.path.getsize(path) > memory_items * 8:
+        blocks = _file_blocks(path, min(BLOCK_ITEMS, memory_items))
+        return _unique_blocks(blocks, memory_items, max(partitions, 2), directory, salt + 1)
+    np.unique(np.fromfile(path, dtype=np.int64)).tofile(path)
+    return _read_file(path)
+
+
+def _chain(buffered, blocks):
+    yield from buffered
+    yield from blocks
+
+
+def _fold(value):
+    # числа из int64 дают тот же uint64, что и astype в _mix; более широкие сворачиваются хешем байтов,
+    # а не по модулю 2 ** 64, чтобы 2 ** 64 + 1 не совпадало с 1
+    value = int(value)
+    if _LIMITS[0] <= value <= _LIMITS[1]:
+        return value & 0xFFFFFFFFFFFFFFFF
+    data = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class HyperLogLog:
+    # 2 ** precision регистров по байту; относительная ошибка около 1.04 / sqrt(2 ** precision)
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision должна быть от 4 до 18")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add(self, values):
+        values = np.asarray(values).ravel()
+        if values.dtype == object:
+            values = np.array([_fold(value) for value in values.tolist()], dtype=np.uint64)
+        elif values.dtype.kind != "u":
+            values = values.astype(np.int64, copy=False)
+        hashes = _mix(values)
+        shift = np.uint64(64 - self.precision)
+        index = (hashes >> shift).astype(np.intp)
+        rest = hashes << np.uint64(self.precision)
+        # длина в битах по старшей и младшей половинам - обе точно представимы во float64
+        high = (rest >> np.uint64(32)).astype(np.float64)
+        low = (rest & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        length = np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+        rank = np.minimum(65 - length, 65 - self.precision).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def update(self, values, block_items=BLOCK_ITEMS):
+        for block in _blocks(values, block_items):
+            self.add(block)
+        return self
+
+    def merge(self, other):
+        merged = HyperLogLog(self.precision)
+        merged.registers = np.maximum(self.registers, other.registers)
+        return merged
+
+    def __len__(self):
+        return round(self.estimate())
+
+    def estimate(self):
+        size = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / size)
+        raw = alpha * size * size / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * size and zeros:
+            # на малых количествах точнее линейный подсчёт по пустым регистрам
+            return size * np.log(size / zeros)
+        return float(raw)
+
+
+def count_distinct(values, precision=14):
+    return HyperLogLog(precision).update(values).estimate()
@@ -0,0 +1,83 @@
+"""Палиндромы: проверка без копий строки, алгоритм Манакера и пакетная проверка файла."""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Iterator, List
+
+
+def is_palindrome(text: str) -> bool:
+    # два указателя идут навстречу и пропускают всё, кроме букв и цифр
+    left, right = 0, len(text) - 1
+    while left < right:
+        if not text[left].isalnum():
+            left += 1
+        elif not text[right].isalnum():
+            right -= 1
+        elif text[left].lower() != text[right].lower():
+            return False
+        else:
+            left += 1
+            right -= 1
+    return True
+
+
+def is_number_palindrome(number: int) -> bool:
+    # разворачиваем только младшую половину цифр, без str()
+    if number < 0 or (number % 10 == 0 and number != 0):
+        return False
+    reverted = 0
+    while number > reverted:
+        number, digit = divmod(number, 10)
+        reverted = reverted * 10 + digit
+    return number in (reverted, reverted // 10)
+
+
+def manacher(text: str) -> List[int]:
+    # радиусы палиндромов в строке с разделителями "#a#b#": radius[i] - длина палиндрома
+    # исходной строки с центром в позиции i, всё за O(n)
+    joined = "#" + "#".join(text) + "#"
+    radius = [0] * len(joined)
+    center = right = 0
+    for index in range(len(joined)):
+        if index < right:
+            radius[index] = min(right - index, radius[2 * center - index])
+        while (
+            index - radius[index] - 1 >= 0
+            and index + radius[index] + 1 < len(joined)
+            and joined[index - radius[index] - 1] == joined[index + radius[index] + 1]
+        ):
+            radius[index] += 1
+        if index + radius[index] > right:
+            center, right = index, index + radius[index]
+    return radius
+
+
+def longest_palindrome(text: str) -> str:
+    if not text:
+        return ""
+    radius = manacher(text)
+    best = max(range(len(radius)), key=radius.__getitem__)
+    start = (best - radius[best]) // 2
+    return text[start : start + radius[best]]
+
+
+def count_palindromes(text: str) -> int:
+    # с центром в позиции i лежат (radius[i] + 1) // 2 палиндромов исходной строки
+    return sum((value + 1) // 2 for value in manacher(text))
+
+
+def check_lines(lines, workers=None, processes=False, chunk_lines=1 << 14) -> Iterator[bool]:
+    # проверка записей пулом; порядок результатов совпадает с порядком строк
+    executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    lines = iter(lines)
+    with executor(max_workers=workers) as pool:
+        while True:
+            block = [line.rstrip("\r\n") for line in islice(lines, chunk_lines)]
+            if not block:
+                return
+            yield from pool.map(is_palindrome, block, chunksize=max(1, len(block) // 64))
+
+
+def check_file(path, workers=None, processes=True) -> Iterator[bool]:
+    with open(path, encoding="utf-8") as file:
+        yield from check_lines(file, workers, processes)
@@ -0,0 +1,72 @@
+"""Подсчёт установленных битов: для одного числа, для массивов uint64 и для битовых карт произвольной длины.
+
+Запуск как модуля читает числа по одному на строку и печатает их веса:
+    python -m common.popcount < hashes.txt
+"""
+
+import sys
+
+import numpy as np
+
+BYTE_TABLE = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+CHUNK_LINES = 1 << 16
+
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+
+
+def popcount(number: int) -> int:
+    # для отрицательных считаются биты модуля, как у bin(x).count("1")
+    return number.bit_count()
+
+
+def _swar(values: np.ndarray) -> np.ndarray:
+    values = values - ((values >> np.uint64(1)) & _M1)
+    values = (values & _M2) + ((values >> np.uint64(2)) & _M2)
+    values = (values + (values >> np.uint64(4))) & _M4
+    return (values * _H01) >> np.uint64(56)
+
+
+def popcount_array(values) -> np.ndarray:
+    values = np.asarray(values, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    return _swar(values).astype(np.uint8)
+
+
+def popcount_buffer(buffer) -> int:
+    # битовая карта любой длины: bytes, bytearray, memoryview, mmap
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    whole = data.shape[0] - data.shape[0] % 8
+    total = int(popcount_array(data[:whole].view(np.uint64)).sum(dtype=np.uint64))
+    return total + int(BYTE_TABLE[data[whole:]].sum())
+
+
+def _weights(lines):
+    try:
+        return popcount_array(np.array(lines, dtype=np.uint64)).tolist()
+    except (ValueError, OverflowError):
+        # отрицательные или не влезающие в 64 бита числа считаем по одному
+        return [popcount(int(line)) for line in lines]
+
+
+def stream(source=None, target=None, chunk_lines=CHUNK_LINES):
+    source = source or sys.stdin.buffer
+    target = target or sys.stdout.buffer
+    lines = []
+    for line in source:
+        line = line.strip()
+        if line:
+            lines.append(line)
+        if len(lines) >= chunk_lines:
+            target.write(b"".join(b"%d\n" % weight for weight in _weights(lines)))
+            lines = []
+    if lines:
+        target.write(b"".join(b"%d\n" % weight for weight in _weights(lines)))
+    target.flush()
+
+
+if __name__ == "__main__":
+    stream()
@@ -0,0 +1,87 @@
+"""Быстрое чтение целых чисел из stdin или файла одним куском, а не по input() на строку.
+
+Числа могут быть разделены пробелами, переводами строк или и тем и другим.
+"""
+
+import mmap
+import os
+import sys
+from array import array
+
+import numpy as np
+
+_LIMITS = (np.iinfo(np.int64).min, np.iinfo(np.int64).max)
+CHUNK_BYTES = 1 << 24
+WHITESPACE = b" \t\n\r\v\f"
+
+
+def _chunks(data, chunk_bytes=CHUNK_BYTES):
+    # np.fromstring принимает только bytes: bytes разбираются как есть, а mmap и прочие буферы
+    # копируются кусками по chunk_bytes, а не целиком; кусок заканчивается на разделителе
+    if isinstance(data, bytes):
+        yield data
+        return
+    start = 0
+    while start < len(data):
+        end = min(start + chunk_bytes, len(data))
+        while start < end < len(data) and data[end - 1] not in WHITESPACE:
+            end -= 1
+        if end == start:
+            # число длиннее куска - в int64 оно заведомо не помещается
+            yield None
+            return
+        yield bytes(data[start:end])
+        start = end
+
+
+def _parse_numpy(data):
+    parts = []
+    for chunk in _chunks(data):
+        if chunk is None:
+            return None
+        # из куска, где одни пробелы, np.fromstring сделал бы [0]
+        if not chunk or chunk.isspace():
+            continue
+        try:
+            values = np.fromstring(chunk, dtype=np.int64, sep=" ")
+        except ValueError:
+            # "1_000" и прочее, что понимает int(), но не np.fromstring; ошибку сообщит точный разбор
+            return None
+        # np.fromstring молча насыщает числа вне int64 - такие входы разбираем точно
+        if values.size and (values.min() == _LIMITS[0] or values.max() == _LIMITS[1]):
+            return None
+        parts.append(values)
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+def parse_ints(data, use_numpy=True):
+    """Разбор байтов в np.ndarray int64, array('q') без NumPy или list для чисел шире 64 бит.
+
+    Пустой ввод или ввод из одних пробелов даёт пустой результат.
+    """
+    if use_numpy:
+        values = _parse_numpy(data)
+        if values is not None:
+            return values
+    tokens = bytes(data).split()
+    try:
+        return array("q", map(int, tokens))
+    except OverflowError:
+        return list(map(int, tokens))
+
+
+def read_ints(source=None, use_numpy=True):
+    """Все числа из source: путь к файлу (через mmap) или бинарный поток, по умолчанию sys.stdin.buffer."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return parse_ints(b"", use_numpy)
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return parse_ints(mapped, use_numpy)
+    stream = sys.stdin.buffer if source is None else source
+    return parse_ints(stream.read(), use_numpy)
+
+
+def is_interactive():
+    # скрипты с подсказками input() оставляют их для терминала, а поток из файла читают целиком
+    return sys.stdin.isatty()
@@ -0,0 +1,92 @@
+"""Размах (max - min): за один проход, в скользящем окне и пакетно на NumPy."""
+
+from collections import deque
+from itertools import islice
+
+import numpy as np
+
+CHUNK = 1 << 16
+
+
+def min_max(values, chunk=CHUNK):
+    # один проход по потоку: кусок, пока он в кеше, сразу даёт и минимум, и максимум
+    if isinstance(values, np.ndarray):
+        # у массивов свои редукции: встроенные min/max упаковывали бы каждый элемент в скаляр NumPy
+        values = values.ravel()
+        extremes = (
+            (part.min().item(), part.max().item())
+            for part in (values[start : start + chunk] for start in range(0, values.size, chunk))
+        )
+    else:
+        iterator = iter(values)
+        parts = iter(lambda: list(islice(iterator, chunk)), [])
+        extremes = ((min(part), max(part)) for part in parts)
+    low = high = None
+    for part_low, part_high in extremes:
+        if low is None:
+            low, high = part_low, part_high
+        else:
+            low, high = min(low, part_low), max(high, part_high)
+    if low is None:
+        raise ValueError("размах пустой последовательности не определён")
+    return low, high
+
+
+def spread(values):
+    low, high = min_max(values)
+    return high - low
+
+
+def sliding_spread(values, window):
+    # монотонные очереди индексов: у максимумов значения убывают, у минимумов возрастают,
+    # каждый индекс входит и выходит по разу - O(n) на весь ряд
+    if window < 1:
+        raise ValueError("окно должно быть не меньше 1")
+    highs, lows = deque(), deque()
+    for index, value in enumerate(values):
+        while highs and highs[-1][1] <= value:
+            highs.pop()
+        highs.append((index, value))
+        while lows and lows[-1][1] >= value:
+            lows.pop()
+        lows.append((index, value))
+        start = index - window + 1
+        if start < 0:
+            continue
+        if highs[0][0] < start:
+            highs.popleft()
+        if lows[0][0] < start:
+            lows.popleft()
+        yield highs[0][1] - lows[0][1]
+
+
+def _window_extreme(values, window, ufunc, fill):
+    # ван Херк - Гиль-Верман: префиксы и суффиксы экстремумов внутри блоков длины window,
+    # экстремум окна = экстремум суффикса одного блока и префикса следующего
+    size = values.size
+    blocks = -(-size // window)
+    padded = np.full(blocks * window, fill, dtype=values.dtype)
+    padded[:size] = values
+    shaped = padded.reshape(blocks, window)
+    prefix = ufunc.accumulate(shaped, axis=1).ravel()
+    suffix = ufunc.accumulate(shaped[:, ::-1], axis=1)[:, ::-1].ravel()
+    count = size - window + 1
+    return ufunc(suffix[:count], prefix[window - 1 : window - 1 + count])
+
+
+def sliding_spread_array(values, window):
+    values = np.asarray(values)
+    if window < 1:
+        raise ValueError("окно должно быть не меньше 1")
+    if values.size < window:
+        return np.empty(0, dtype=values.dtype)
+    info = np.iinfo(values.dtype) if values.dtype.kind in "iu" else np.finfo(values.dtype)
+    highs = _window_extreme(values, window, np.maximum, info.min)
+    lows = _window_extreme(values, window, np.minimum, info.max)
+    if values.dtype.kind not in "iu":
+        return highs - lows
+    # размах в узком типе переполняется (int8: 100 - (-100)); узкие целые вычитаются в int64,
+    # 64-битные - в uint64, где разность high - low >= 0 точна по модулю 2 ** 64
+    if values.dtype.itemsize < 8:
+        return np.subtract(highs, lows, dtype=np.int64)
+    return highs.astype(np.uint64) - lows.astype(np.uint64)
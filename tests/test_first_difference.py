@@ -0,0 +1,33 @@
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load(name, path):
+    spec = importlib.util.spec_from_file_location(name, ROOT / path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+first_difference = _load("abramchuk_1", "reports/Abramchuk/1/src/1.py")
+
+
+def test_whitespace_only_chunk(tmp_path):
+    path = tmp_path / "numbers.txt"
+    path.write_bytes(b"5\n5\n\n")
+    assert first_difference.first_difference_text(path, chunk_bytes=4) is None
+
+
+def test_trailing_spaces_between_chunks(tmp_path):
+    path = tmp_path / "numbers.txt"
+    path.write_bytes(b"7     7   \n \n  8\n")
+    for size in range(1, 20):
+        assert first_difference.first_difference_text(path, chunk_bytes=size) == 2
+
+
+def test_empty_binary_file(tmp_path):
+    path = tmp_path / "numbers.bin"
+    path.write_bytes(b"")
+    assert first_difference.first_difference_binary(path) is None